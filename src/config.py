@@ -1,4 +1,15 @@
-from PySide6.QtGui import QFont
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def create_font(style, size, bold):
+    """
+    Create a QFont once per (style, size, bold), importing Qt only when a font is needed.
+
+    """
+    from PySide6.QtGui import QFont  # Deferred so headless imports of config skip Qt
+
+    return QFont(style, size, QFont.Bold if bold else QFont.Normal)
 
 
 class BaseConfig:
@@ -7,6 +18,8 @@ class BaseConfig:
 
     """
 
+    __slots__ = ()  # No per-instance __dict__, settings are read-only class constants
+
     # Common configuration settings go here
 
 
@@ -16,6 +29,8 @@ class FormatsConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     LOGGING_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
     TIME_FORMAT = "%H:%M"
 
@@ -26,12 +41,20 @@ class FontsConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     FONT_SIZE_HEADER = 12
     FONT_SIZE_SUBHEADER = 10
     FONT_SIZE_BODY = 8
     FONT_STYLE = "Sans"
-    FONT_WEIGHT_BOLD = QFont.Bold
-    FONT_SPINBOX = QFont(FONT_STYLE, FONT_SIZE_BODY, FONT_WEIGHT_BOLD)
+
+    @property
+    def FONT_SPINBOX(self):
+        """
+        Bold body font used for spinboxes and emphasized labels.
+
+        """
+        return create_font(self.FONT_STYLE, self.FONT_SIZE_BODY, True)
 
 
 class KeysConfig(BaseConfig):
@@ -40,6 +63,8 @@ class KeysConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     # Dictionary Keys
     JUDGING = "judging"
     PRACTICE = "practice"
@@ -74,6 +99,8 @@ class ValuesConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     LOCATION_TYPE_ROOM = "room"
     LOCATION_TYPE_TABLE = "table"
 
@@ -86,6 +113,8 @@ class TournamentDataDefaultConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     NUM_TEAMS = 42
     NUM_ROOMS = 6
     NUM_TABLES = 4
@@ -105,6 +134,8 @@ class TimeDataDefaultConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     JUDGING_ROUNDS_START_TIME = "08:00"
     PRACTICE_ROUNDS_START_TIME = "09:00"
     PRACTICE_ROUNDS_STOP_TIME = "12:00"
@@ -126,6 +157,7 @@ class TimeDataDefaultConfig(BaseConfig):
         KeysConfig.TABLE: [],
     }
     MINUTES_PER_HOUR = 60
+    HOURS_PER_DAY = 24
     SECS_IN_MINUTE = 60
 
 
@@ -135,6 +167,8 @@ class QLearningDefaultConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     LEARNING_RATE = 0.20
     DISCOUNT_FACTOR = 0.80
     EPSILON_START = 1.00
@@ -149,6 +183,8 @@ class SoftConstraintDefaultConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     TABLE_CONSISTENCY_WEIGHT = 1.0
     OPPONENT_VARIETY_WEIGHT = 1.0
     BACK_TO_BACK_PENALTY_WEIGHT = 1.0
@@ -167,7 +203,14 @@ class GUIConfig(BaseConfig):
 
     """
 
-    REFRESH_INTERVAL = 1
+    __slots__ = ()
+
+    MAX_REFRESH_RATE = 10  # GUI redraws per second during training
+    MAX_REFRESH_RATE_LIMIT = 60
+    UPDATE_COALESCE_INTERVAL = 30  # Milliseconds
+    EPSILON_DECAY_DEBOUNCE_INTERVAL = 150  # Milliseconds, outlasts spinbox auto-repeat
+    ACK_POLL_INTERVAL = 100  # Milliseconds between stop checks while waiting on the GUI
+    OPTIMAL_EPISODE = -2  # Sentinel episode sent once the optimal schedule is ready
     WINDOW_TITLE = "FIRST LEGO League Challenge Q-Learning Tournament Scheduler"
 
 
@@ -177,6 +220,8 @@ class ExportConfig(BaseConfig):
 
     """
 
+    __slots__ = ()
+
     CSV_EXT = ".csv"
     TXT_EXT = ".txt"
     XLSX_EXT = ".xlsx"
@@ -1,11 +1,31 @@
 import os
+import io
 import csv
-import pandas as pd
+import shutil
+from functools import lru_cache
 from config import ExportConfig
 
 EXPORT = ExportConfig()
 
 
+@lru_cache(maxsize=None)
+def format_round(round_type):
+    """
+    Format a round type for export, e.g. "practice" -> "Practice Round".
+
+    """
+    return f"{round_type.capitalize()} Round"
+
+
+@lru_cache(maxsize=None)
+def format_location(location_type, location_id):
+    """
+    Format a location for export, e.g. ("table", "A1") -> "Table A1".
+
+    """
+    return f"{location_type.capitalize()} {location_id}"
+
+
 class QLearningExporter:
     """
     Class to export Q-Learning data to CSV and Excel files.
@@ -17,7 +37,6 @@ class QLearningExporter:
         Initialize QLearningExporter object.
 
         """
-        self.clear_exports_directory()
         self.dataframe = None
         self.excel_file_path = (
             EXPORT.EXPORTS_DIRECTORY
@@ -30,24 +49,44 @@ class QLearningExporter:
         Clear the exports directory.
 
         """
-        for root, _, files in os.walk(EXPORT.EXPORTS_DIRECTORY):
-            for filename in files:
-                file_path = os.path.join(root, filename)
-                try:
-                    if os.path.isfile(file_path):
-                        os.unlink(file_path)
-                except OSError as e:
-                    print(f"Failed to delete {file_path}. Reason: {e}")
+        # Drop the whole tree at once, then recreate the expected layout
+        shutil.rmtree(EXPORT.EXPORTS_DIRECTORY, ignore_errors=True)
+        os.makedirs(
+            f"{EXPORT.EXPORTS_DIRECTORY}{EXPORT.TRAINING_SCHEDULES_DIRECTORY}",
+            exist_ok=True,
+        )
+
+    def write_csv(self, file_path, header, rows):
+        """
+        Write the header and rows to a CSV file with a single write.
+
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(header)
+        writer.writerows(rows)
+        with open(file_path, "w", newline="", encoding="utf-8") as file:
+            file.write(buffer.getvalue())
+        return file_path
 
     def transform_dataframe_to_grid(self, dataframe, sheet_name, writer):
         """
         Transform the DataFrame into grid format and write to Excel.
 
         """
-        pivot_dataframe = dataframe.pivot_table(
-            index=EXPORT.COL_TIME, columns=[EXPORT.COL_LOCATION], values=EXPORT.COL_TEAM
-        ).reset_index()
-        pivot_dataframe.columns = [i for i in pivot_dataframe.columns]
+        # Each (time, location) holds at most one team, so a reshape is enough.
+        # Empty rows and columns are dropped, as pivot_table did.
+        pivot_dataframe = (
+            dataframe.pivot(
+                index=EXPORT.COL_TIME,
+                columns=EXPORT.COL_LOCATION,
+                values=EXPORT.COL_TEAM,
+            )
+            .dropna(how="all")
+            .dropna(axis=1, how="all")
+            .reset_index()
+        )
+        pivot_dataframe.columns.name = None
         pivot_dataframe.sort_index(axis=1, inplace=True)
         pivot_dataframe.to_excel(writer, sheet_name=sheet_name, index=False)
 
@@ -56,21 +95,19 @@ class QLearningExporter:
         Convert the Q-Table to a list of rows for CSV export.
 
         """
-        q_table_rows = []
-        for (
-            (time_start, _, round_type, location_type, location_id, _),
-            action,
-        ), value in q_table.items():
-            q_table_rows.append(
-                [
-                    time_start,
-                    f"{round_type.capitalize()} Round",
-                    f"{location_type.capitalize()} {location_id}",
-                    action,
-                    value,
-                ]
+        return [
+            (
+                time_start,
+                format_round(round_type),
+                format_location(location_type, location_id),
+                action,
+                value,
             )
-        return q_table_rows
+            for (
+                (time_start, _, round_type, location_type, location_id, _),
+                action,
+            ), value in q_table.items()
+        ]
 
     def export_q_table_to_csv(self, file_path, q_table):
         """
@@ -78,36 +115,32 @@ class QLearningExporter:
 
         """
         q_table_rows = self.convert_q_table_to_rows(q_table)
-        with open(file_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                [
-                    EXPORT.COL_TIME,
-                    EXPORT.COL_ROUND,
-                    EXPORT.COL_LOCATION,
-                    EXPORT.COL_TEAM,
-                    EXPORT.COL_QVALUE,
-                ]
-            )
-            writer.writerows(q_table_rows)
-        return file_path
+        return self.write_csv(
+            file_path,
+            [
+                EXPORT.COL_TIME,
+                EXPORT.COL_ROUND,
+                EXPORT.COL_LOCATION,
+                EXPORT.COL_TEAM,
+                EXPORT.COL_QVALUE,
+            ],
+            q_table_rows,
+        )
 
     def convert_schedule_to_rows(self, schedule):
         """
         Convert the schedule to a list of rows for CSV export.
 
         """
-        schedule_rows = []
-        for time_start, _, round_type, location_type, location_id, team_id in schedule:
-            schedule_rows.append(
-                [
-                    time_start,
-                    f"{round_type.capitalize()} Round",
-                    f"{location_type.capitalize()} {location_id}",
-                    team_id,
-                ]
+        return [
+            (
+                time_start,
+                format_round(round_type),
+                format_location(location_type, location_id),
+                team_id,
             )
-        return schedule_rows
+            for time_start, _, round_type, location_type, location_id, team_id in schedule
+        ]
 
     def export_schedule_to_csv(self, file_path, schedule):
         """
@@ -115,57 +148,54 @@ class QLearningExporter:
 
         """
         schedule_rows = self.convert_schedule_to_rows(schedule)
-        with open(file_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                [
-                    EXPORT.COL_TIME,
-                    EXPORT.COL_ROUND,
-                    EXPORT.COL_LOCATION,
-                    EXPORT.COL_TEAM,
-                ]
-            )
-            writer.writerows(schedule_rows)
-        return file_path
+        return self.write_csv(
+            file_path,
+            [
+                EXPORT.COL_TIME,
+                EXPORT.COL_ROUND,
+                EXPORT.COL_LOCATION,
+                EXPORT.COL_TEAM,
+            ],
+            schedule_rows,
+        )
 
     def export_optimal_schedule_to_excel(self, file_path, schedule):
         """
         Export the optimal schedule to an Excel file.
 
         """
+        import pandas as pd  # Only needed for the final export, keeps start-up light
+
+        # Keep the CSV deliverable, but build the frame from memory instead of re-reading it
+        columns = [
+            EXPORT.COL_TIME,
+            EXPORT.COL_ROUND,
+            EXPORT.COL_LOCATION,
+            EXPORT.COL_TEAM,
+        ]
         optimal_schedule_rows = self.convert_schedule_to_rows(schedule)
-        with open(file_path, "w", newline="", encoding="utf-8") as file:
-            writer = csv.writer(file)
-            writer.writerow(
-                [
-                    EXPORT.COL_TIME,
-                    EXPORT.COL_ROUND,
-                    EXPORT.COL_LOCATION,
-                    EXPORT.COL_TEAM,
-                ]
-            )
-            writer.writerows(optimal_schedule_rows)
-        self.dataframe = pd.read_csv(file_path)
+        self.write_csv(file_path, columns, optimal_schedule_rows)
+        self.dataframe = pd.DataFrame(optimal_schedule_rows, columns=columns)
         with pd.ExcelWriter(self.excel_file_path, engine="xlsxwriter") as writer:
-            for round_type in self.dataframe[EXPORT.COL_ROUND].unique():
-                filtered_dataframe = self.dataframe[
-                    self.dataframe[EXPORT.COL_ROUND] == round_type
-                ]
+            workbook = writer.book
+            white_format = workbook.add_format({"bg_color": "#FFFFFF"})
+
+            # Split by round once instead of masking the whole frame per round
+            for round_type, filtered_dataframe in self.dataframe.groupby(
+                EXPORT.COL_ROUND, sort=False
+            ):
                 self.transform_dataframe_to_grid(filtered_dataframe, round_type, writer)
-                workbook = writer.book
                 worksheet = writer.sheets[round_type]
-                dataframe_for_sheet = self.dataframe[
-                    self.dataframe[EXPORT.COL_ROUND] == round_type
-                ].dropna()
-                last_row = len(dataframe_for_sheet)
+                # Team is the only column that can be empty, so count it instead of dropna()
+                last_row = int(filtered_dataframe[EXPORT.COL_TEAM].count())
                 worksheet.conditional_format(
                     1,
                     1,
                     last_row,
-                    len(dataframe_for_sheet.columns),
+                    len(filtered_dataframe.columns),
                     {
                         "type": "no_blanks",
-                        "format": workbook.add_format({"bg_color": "#FFFFFF"}),
+                        "format": white_format,
                     },
                 )
         return file_path
@@ -11,15 +11,14 @@ from PySide6.QtWidgets import (
     QGridLayout,
     QHBoxLayout,
     QDoubleSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QProgressBar,
     QSlider,
     QSizePolicy,
     QSplitter,
 )
-from PySide6.QtCore import QTime, Qt, QThread, Slot
-from PySide6.QtGui import QKeySequence, QShortcut, QColor, QBrush
+from PySide6.QtCore import QModelIndex, QTime, Qt, QThread, QTimer, Slot
+from PySide6.QtGui import QKeySequence, QShortcut, QBrush
 from q_learning import QLEARNING, QLearning, initialize_judging_rounds, initialize_schedule
 from training_thread import TrainingWorker
 from typing import Dict, List, Tuple, Any
@@ -34,10 +33,17 @@ from config import (
     SoftConstraintDefaultConfig,
 )
 from collections import defaultdict
+from operator import itemgetter
 from tournament_data import *
 from time_data import *
 from time_data import TimeData
 from data_to_csv import QLearningExporter
+from schedule_table_model import (
+    ScheduleTableModel,
+    get_judging_headers,
+    get_table_round_headers,
+)
+from utilities_qlearning import calculate_epsilon_decays
 
 KEY = KeysConfig()
 FONT = FontsConfig()
@@ -64,7 +70,11 @@ class MainWindow(QWidget):
         self.create_exports_directory()
 
         self.setWindowTitle(GUI.WINDOW_TITLE)
-        self.gui_refresh_interval = GUI.REFRESH_INTERVAL
+        self.gui_max_refresh_rate = GUI.MAX_REFRESH_RATE
+        self.label_cache = {}
+        self.training_running = False
+        self.training_complete = False
+        self.gui_update_handlers = {GUI.OPTIMAL_EPISODE: self.update_gui_optimal}
 
         self.tournament_data = TournamentData()
         self.time_data = TimeData(self.tournament_data)
@@ -180,14 +190,31 @@ class MainWindow(QWidget):
         
         ##############################################################################################################
 
+        # Coalesces bursts of input signals into a single update
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(GUI.UPDATE_COALESCE_INTERVAL)
+        self.update_timer.timeout.connect(self.apply_update)
+
+        # Debounces the epsilon decay labels until the epsilon inputs settle
+        self.epsilon_decay_timer = QTimer(self)
+        self.epsilon_decay_timer.setSingleShot(True)
+        self.epsilon_decay_timer.setInterval(GUI.EPSILON_DECAY_DEBOUNCE_INTERVAL)
+        self.epsilon_decay_timer.timeout.connect(self.update_epsilon_decay_labels)
+
+        self.create_training_thread()
+
+        # Build the whole layout with a single geometry pass
+        self.setUpdatesEnabled(False)
         self.create_gui_components()
         self.initialize_gui_components()
         self.setup_gui_components()
         self.connect_signals_and_slots()
         self.initialize_main_gui()
+        self.setUpdatesEnabled(True)
 
         self.train_button_shortcut = QShortcut(QKeySequence(Qt.CTRL | Qt.Key_G), self)
-        self.train_button_shortcut.activated.connect(self.start_training_thread)
+        self.train_button_shortcut.activated.connect(self.on_train_shortcut_activated)
 
     def initialize_schedule_and_states(self):
         """
@@ -265,10 +292,12 @@ class MainWindow(QWidget):
         self.round_type_groupbox = QGroupBox("Round Types Per Team")
         self.round_type_layout = QGridLayout(self.round_type_groupbox)
 
+        self.practice_spinbox = QSpinBox(self)
+        self.table_spinbox = QSpinBox(self)
         self.round_type_spinboxes = {
             KEY.JUDGING: QLabel(f"{1}"),
-            KEY.PRACTICE: QSpinBox(self),
-            KEY.TABLE: QSpinBox(self),
+            KEY.PRACTICE: self.practice_spinbox,
+            KEY.TABLE: self.table_spinbox,
         }
 
         self.round_type_labels = {}
@@ -497,9 +526,7 @@ class MainWindow(QWidget):
         Sets up the Q-learning inputs in the GUI.
 
         """
-        halfway_decay, total_decay, self.decays = (
-            self.calculate_epsilon_decay_episodes()
-        )
+        halfway_decay, total_decay = self.calculate_epsilon_decay_episodes()
         self.epsilon_halfway_label = QLabel(f"{halfway_decay} Episodes")
         self.epsilon_total_label = QLabel(f"{total_decay} Episodes")
 
@@ -542,12 +569,12 @@ class MainWindow(QWidget):
 
         self.gui_refresh_layout = QHBoxLayout()
 
-        self.gui_refresh_label = QLabel("Refresh GUI every: ")
+        self.gui_refresh_label = QLabel("Refresh GUI at most: ")
         self.gui_refresh_rate = QSpinBox(self)
 
         self.gui_refresh_layout.addWidget(self.gui_refresh_label)
         self.gui_refresh_layout.addWidget(self.gui_refresh_rate)
-        self.gui_refresh_layout.addWidget(QLabel("Episodes"))
+        self.gui_refresh_layout.addWidget(QLabel("Times per Second"))
 
     def initialize_statistics_and_progress(self):
         """
@@ -558,7 +585,8 @@ class MainWindow(QWidget):
         self.current_schedule_length_label.setText(
             f"Required Schedule Slots: {self.q_learning.required_schedule_slots} ({self.q_learning.possible_schedule_slots} Possible)"
         )
-        self.gui_refresh_rate.setValue(self.gui_refresh_interval)
+        self.gui_refresh_rate.setRange(1, GUI.MAX_REFRESH_RATE_LIMIT)
+        self.gui_refresh_rate.setValue(self.gui_max_refresh_rate)
 
     def setup_statistics(self):
         """
@@ -615,11 +643,6 @@ class MainWindow(QWidget):
                 self.q_learning.soft_constraints_weight[constraint] * scale_factor
             )
 
-            # Connect the valueChanged signal of the slider to the on_update method
-            self.soft_constraint_weights[constraint].valueChanged.connect(
-                self.on_update
-            )
-
             # Create the label for the constraint
             self.constraint_label[constraint] = QLabel(
                 f"{constraint}: {self.q_learning.soft_constraints_weight[constraint] * scale_factor:.2f}%"
@@ -636,77 +659,125 @@ class MainWindow(QWidget):
             # Increment the row counter
             row += 1
 
+        # Prebuilt (constraint, slider, label) rows read on every update
+        self.soft_constraint_rows = tuple(
+            (constraint, slider, self.constraint_label[constraint])
+            for constraint, slider in self.soft_constraint_weights.items()
+        )
+
     def create_schedule_display(self):
         """
         Creates the schedule display for the Q-learning scheduler.
 
         """
         # Judging Rounds Table
-        self.judging_table = QTableWidget()
-        self.judging_table.setColumnCount(self.num_rooms + 1)  # Time + Room columns
-        self.judging_table.setHorizontalHeaderLabels(
-            ["Time"] + [f"Room {i+1}" for i in range(self.num_rooms)]
-        )
+        self.judging_model = ScheduleTableModel(self)
+        self.judging_table = QTableView()
+        self.judging_table.setModel(self.judging_model)
 
         # Practice Rounds Table
-        self.practice_table = QTableWidget()
-        self.practice_table.setColumnCount(
-            self.num_tables * 2 + 1
-        )  # Time + Table columns
-        practice_headers = ["Time"] + [
-            f"Table {chr(65 + i // 2)}{i % 2 + 1}" for i in range(self.num_tables * 2)
-        ]
-        self.practice_table.setHorizontalHeaderLabels(practice_headers)
+        self.practice_model = ScheduleTableModel(self)
+        self.practice_table = QTableView()
+        self.practice_table.setModel(self.practice_model)
 
         # Table Rounds Table
-        self.table_round_table = QTableWidget()
-        self.table_round_table.setColumnCount(
-            self.num_tables * 2 + 1
-        )  # Time + Table columns
-        table_round_headers = ["Time"] + [
-            f"Table {chr(65 + i // 2)}{i % 2 + 1}" for i in range(self.num_tables * 2)
-        ]
-        self.table_round_table.setHorizontalHeaderLabels(table_round_headers)
+        self.table_round_model = ScheduleTableModel(self)
+        self.table_round_table = QTableView()
+        self.table_round_table.setModel(self.table_round_model)
+
+        self.schedule_models = {
+            KEY.JUDGING: self.judging_model,
+            KEY.PRACTICE: self.practice_model,
+            KEY.TABLE: self.table_round_model,
+        }
+
+        for table in [self.judging_table, self.practice_table, self.table_round_table]:
+            table.setAlternatingRowColors(True)  # Enable alternating row colors
+            table.setEditTriggers(QTableView.NoEditTriggers)  # Disable editing
 
     def initialize_schedule_display(self):
         """
         Initializes the schedule display for the Q-learning scheduler.
 
         """
-        # Ensure tables are clear and set up before populating
-        self.clear_and_setup_tables()
+        headers = self.get_table_headers()
         self.color_map = init_color_map(self.teams, self.num_teams)
+        self.team_brushes = {
+            team_id: QBrush(color) for team_id, color in self.color_map.items()
+        }
+        # Cell text per team, shared by every rebuild and refresh
+        self.team_texts = {team_id: str(team_id) for team_id in self.color_map}
+        self.team_texts[None] = str(None)
+        team_texts = self.team_texts
 
-        # Initialize a dictionary to track the last row used for each time in each table
+        # Track the row used for each time in each table, and the rows themselves
         last_row = {KEY.JUDGING: {}, KEY.PRACTICE: {}, KEY.TABLE: {}}
+        rows = {KEY.JUDGING: [], KEY.PRACTICE: [], KEY.TABLE: []}
+        # Column per (round_type, location_id), computed once per location
+        self.col_index = col_index = {}
 
-        # Iterate over each entry in the sorted schedule
-        for entry in sorted(self.q_learning.schedule, key=lambda x: (x[0], x[2], x[4])):
+        # Build every table's rows in one pass over the sorted schedule
+        for entry in sorted(self.q_learning.schedule, key=itemgetter(0, 2, 4)):
             time_start, _, round_type, _, location_id, team_id = entry
 
-            table_widget = self.get_table_widget(round_type)
+            round_rows = rows[round_type]
+            width = len(headers[round_type])
 
             # If this time_start has not been used in this table, add a new row for it
             if time_start not in last_row[round_type]:
-                newRow = table_widget.rowCount()
-                table_widget.insertRow(newRow)
-                table_widget.setItem(
-                    newRow, 0, QTableWidgetItem(time_start)
-                )  # Set the time in the first column
-                last_row[round_type][time_start] = newRow
+                last_row[round_type][time_start] = len(round_rows)
+                round_rows.append([time_start] + [None] * (width - 1))
 
             row = last_row[round_type][time_start]
+            col = col_index.get((round_type, location_id))
+            if col is None:
+                col = self.get_col_index(round_type, location_id)
+                col_index[(round_type, location_id)] = col
+            if col < width:
+                round_rows[row][col] = team_texts.get(team_id) or str(team_id)
+
+        # One model reset per table instead of one item per cell
+        for round_type, model in self.schedule_models.items():
+            model.set_schedule(headers[round_type], rows[round_type], self.team_brushes)
 
-            # Calculate the column for this entry. Adjust get_col_index to fit your logic
-            col = self.get_col_index(round_type, location_id)
+        self.schedule_rows = last_row
 
-            item = QTableWidgetItem(str(team_id))
-            table_widget.setItem(row, col, item)
+    def update_schedule_display(self):
+        """
+        Updates only the schedule display cells whose team changed since the last refresh.
+
+        Falls back to a full rebuild when the schedule contains a time slot without a row.
 
-            # Generate a unique color for each team if not already in the color map
-            if team_id is not None:
-                color = self.color_map.get(team_id)
-                item.setBackground(QBrush(color))
+        """
+        schedule_rows = self.schedule_rows
+        schedule_models = self.schedule_models
+        col_index = self.col_index
+        team_texts = self.team_texts
+        changed_models = set()
+
+        for entry in self.q_learning.schedule:
+            time_start, _, round_type, _, location_id, team_id = entry
+            row = schedule_rows[round_type].get(time_start)
+            if row is None:
+                self.initialize_schedule_display()
+                return
+
+            col = col_index.get((round_type, location_id))
+            if col is None:
+                col = self.get_col_index(round_type, location_id)
+                col_index[(round_type, location_id)] = col
+            model = schedule_models[round_type]
+            cells = model.rows[row]
+            text = team_texts.get(team_id) or str(team_id)
+            if col >= len(cells) or cells[col] == text:
+                continue
+
+            cells[col] = text
+            changed_models.add(model)
+
+        # One dataChanged per table that actually changed
+        for model in changed_models:
+            model.refresh()
 
     def setup_schedule_display(self):
         """
@@ -753,46 +824,17 @@ class MainWindow(QWidget):
         # Add the splitter to the schedule layout
         self.schedule_layout.addWidget(schedule_splitter)
 
-    def clear_and_setup_tables(self):
-        """
-        Clears and sets up the judging, practice, and table round tables.
-
-        """
-        for table in [self.judging_table, self.practice_table, self.table_round_table]:
-            table.clearContents()  # Clear the contents of the table
-            table.setColumnCount(0)  # Clear the columns
-            table.setRowCount(0)  # Clear the rows
-            table.setAlternatingRowColors(True)  # Enable alternating row colors
-            table.setEditTriggers(QTableWidget.NoEditTriggers)  # Disable editing
-
-            if table is self.judging_table:
-                # Set column count and header labels for judging table
-                table.setColumnCount(self.num_rooms + 1)
-                table.setHorizontalHeaderLabels(
-                    ["Time"] + [f"Room {i+1}" for i in range(self.num_rooms)]
-                )
-            else:
-                # Set column count and header labels for practice and table round tables
-                table.setColumnCount((self.num_tables * 2) + 1)
-                table.setHorizontalHeaderLabels(
-                    ["Time"]
-                    + [
-                        f"Table {chr(65 + i // 2)}{i % 2 + 1}"
-                        for i in range(self.num_tables * 2)
-                    ]
-                )
-
-    def get_table_widget(self, round_type):
+    def get_table_headers(self):
         """
-        Returns the table widget based on the round type.
+        Returns the header labels of the judging, practice, and table round tables.
 
         """
-        if round_type == KEY.JUDGING:
-            return self.judging_table
-        elif round_type == KEY.PRACTICE:
-            return self.practice_table
-        else:  # KEY.TABLE
-            return self.table_round_table
+        table_headers = get_table_round_headers(self.num_tables)
+        return {
+            KEY.JUDGING: get_judging_headers(self.num_rooms),
+            KEY.PRACTICE: table_headers,
+            KEY.TABLE: table_headers,
+        }
 
     def get_col_index(self, round_type, location_id):
         """
@@ -878,12 +920,12 @@ class MainWindow(QWidget):
         self.num_tables_spinbox.valueChanged.connect(
             self.on_update
         )  # Connects the valueChanged signal of num_tables_spinbox to the on_update slot function
-        self.round_type_spinboxes[KEY.PRACTICE].valueChanged.connect(
+        self.practice_spinbox.valueChanged.connect(
             self.on_update
-        )  # Connects the valueChanged signal of round_type_spinboxes[KEY.PRACTICE] to the on_update slot function
-        self.round_type_spinboxes[KEY.TABLE].valueChanged.connect(
+        )  # Connects the valueChanged signal of practice_spinbox to the on_update slot function
+        self.table_spinbox.valueChanged.connect(
             self.on_update
-        )  # Connects the valueChanged signal of round_type_spinboxes[KEY.TABLE] to the on_update slot function
+        )  # Connects the valueChanged signal of table_spinbox to the on_update slot function
 
         # Q-Learning Inputs
         self.alpha_input.valueChanged.connect(
@@ -901,6 +943,14 @@ class MainWindow(QWidget):
         self.epsilon_decay_input.valueChanged.connect(
             self.on_update
         )  # Connects the valueChanged signal of epsilon_decay_input to the on_update slot function
+        for epsilon_input in (
+            self.epsilon_start_input,
+            self.epsilon_end_input,
+            self.epsilon_decay_input,
+        ):
+            epsilon_input.valueChanged.connect(
+                lambda: self.epsilon_decay_timer.start()
+            )  # Restarts the epsilon decay debounce on every epsilon change
         self.training_episodes_input.valueChanged.connect(
             self.on_update
         )  # Connects the valueChanged signal of training_episodes_input to the on_update slot function
@@ -909,28 +959,22 @@ class MainWindow(QWidget):
         self.gui_refresh_rate.valueChanged.connect(
             self.on_update
         )  # Connects the valueChanged signal of gui_refresh_rate to the on_update slot function
-        self.soft_constraint_weights[KEY.TABLE_CONSISTENCY].valueChanged.connect(
-            self.on_update
-        )  # Connects the valueChanged signal of soft_constraint_weights[KEY.TABLE_CONSISTENCY] to the on_update slot function
-        self.soft_constraint_weights[KEY.OPPONENT_VARIETY].valueChanged.connect(
-            self.on_update
-        )  # Connects the valueChanged signal of soft_constraint_weights[KEY.OPPONENT_VARIETY] to the on_update slot function
-        self.soft_constraint_weights[KEY.BACK_TO_BACK_PENALTY].valueChanged.connect(
-            self.on_update
-        )  # Connects the valueChanged signal of soft_constraint_weights[KEY.BACK_TO_BACK_PENALTY] to the on_update slot function
-        self.soft_constraint_weights[KEY.BREAK_TIME].valueChanged.connect(
-            self.on_update
-        )  # Connects the valueChanged signal of soft_constraint_weights[KEY.BREAK_TIME] to the on_update slot function
+        for constraint, slider, label in self.soft_constraint_rows:
+            slider.valueChanged.connect(
+                lambda value, constraint=constraint, label=label: self.update_soft_constraint(
+                    constraint, label, value
+                )
+            )  # Connects the valueChanged signal of each soft constraint slider to update only its own weight and label
 
         # Buttons
         self.train_button.clicked.connect(
-            self.start_training_thread
-        )  # Connects the clicked signal of train_button to the start_training_thread slot function
+            self.on_train_button_clicked
+        )  # Connects the clicked signal of train_button to the on_train_button_clicked slot function
 
         # Schedule
-        self.judging_table.itemClicked.connect(self.on_item_clicked)
-        self.practice_table.itemClicked.connect(self.on_item_clicked)
-        self.table_round_table.itemClicked.connect(self.on_item_clicked)
+        self.judging_table.clicked.connect(self.on_item_clicked)
+        self.practice_table.clicked.connect(self.on_item_clicked)
+        self.table_round_table.clicked.connect(self.on_item_clicked)
 
     def initialize_main_gui(self):
         """
@@ -963,28 +1007,77 @@ class MainWindow(QWidget):
         # Add the column splitter to the main layout
         main_layout.addWidget(column_splitter, 0, 0)
 
+    def create_training_thread(self):
+        """
+        Creates the persistent training thread and worker, reused by every training run.
+
+        """
+        self.thread = QThread(self)
+        self.worker = TrainingWorker(self.q_learning)
+        self.worker.moveToThread(self.thread)
+
+        self.worker.signals.update_gui_signal.connect(
+            self.update_gui_total, Qt.QueuedConnection
+        )
+        self.worker.finished.connect(self.on_training_finished, Qt.QueuedConnection)
+
+        self.thread.start()
+
+    @Slot()
+    def on_train_button_clicked(self):
+        """
+        Starts training, or closes the window once the optimal schedule is generated.
+
+        """
+        if self.training_running:
+            return
+        if self.training_complete:
+            self.close()
+        else:
+            self.start_training_thread()
+
+    @Slot()
+    def on_train_shortcut_activated(self):
+        """
+        Starts training from the shortcut, ignored while a run is active or complete.
+
+        """
+        if self.training_running or self.training_complete:
+            return
+        self.start_training_thread()
+
     def start_training_thread(self):
         """
-        Starts the training thread for the Q-learning scheduler.
+        Starts a training run on the training thread for the Q-learning scheduler.
 
         """
+        # Apply any input change still waiting on the coalesce timer
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            self.apply_update()
+
         training_episodes = int(
             self.training_episodes_input.value()
         )  # Assuming you have an input field for training_episodes
         self.q_learning.training_episodes = training_episodes
         self.initialize_schedule_display()
 
-        self.thread = QThread()
-        self.worker = TrainingWorker(self.q_learning)
-        self.worker.moveToThread(self.thread)
+        # Constant for the duration of the run
+        self.run_training_episodes = training_episodes
+        self.run_q_table_size_limit = self.q_learning.q_table_size_limit
 
-        self.worker.signals.update_gui_signal.connect(
-            self.update_gui_total, Qt.QueuedConnection
-        )
+        self.training_running = True
+        self.worker.run_requested.emit()
 
-        self.thread.started.connect(self.worker.run, Qt.QueuedConnection)
+    def closeEvent(self, event):
+        """
+        Stops the training thread when the window is closed.
 
-        self.thread.start()
+        """
+        self.worker.request_stop()
+        self.thread.quit()
+        self.thread.wait()
+        super().closeEvent(event)
 
     def calculate_epsilon_decay_episodes(self):
         """
@@ -996,51 +1089,23 @@ class MainWindow(QWidget):
         epsilon_end = self.epsilon_end_input.value()
         epsilon_decay = self.epsilon_decay_input.value()
 
-        epsilon_halfway = 0.5
-        ep_count = 0
-        ep_count_half = 0
-        epsilon_decay_list = []
-
-        # Calculate epsilon decay until it reaches the end value
-        while epsilon_start > epsilon_end:
-            epsilon_start *= epsilon_decay
-            ep_count += 1
+        return calculate_epsilon_decays(epsilon_start, epsilon_end, epsilon_decay)
 
-            # Check if epsilon is greater than halfway
-            if epsilon_start > epsilon_halfway:
-                ep_count_half += 1
-
-            epsilon_decay_list.append(epsilon_start)
-
-        return ep_count_half, ep_count, epsilon_decay_list
+    @Slot(QModelIndex)
+    def on_item_clicked(self, index):
+        """
+        Highlights every cell in the schedule display with the clicked value.
 
-    @Slot()
-    def on_item_clicked(self, item):
-        if item is None:
+        """
+        if not index.isValid():
             return
 
         # Get the clicked value
-        value = item.text()
+        value = index.data()
 
-        # Iterate over all table widgets
-        for table_widget in [
-            self.judging_table,
-            self.practice_table,
-            self.table_round_table,
-        ]:
-            # Iterate over all items in the table
-            for row in range(table_widget.rowCount()):
-                for col in range(table_widget.columnCount()):
-                    curr_item = table_widget.item(row, col)
-                    if curr_item is not None and curr_item.text() == value:
-                        # Highlight the item if it has the same value
-                        curr_item.setBackground(QBrush(QColor("yellow")))
-                    else:
-                        # Reset the color if it does not have the same value
-                        if curr_item.text() != "None" and ":" not in curr_item.text():
-                            curr_item.setBackground(
-                                QBrush(self.color_map.get(int(curr_item.text())))
-                            )
+        # Highlight matching cells in all tables, the rest fall back to their team color
+        for model in self.schedule_models.values():
+            model.set_highlight(value)
 
     @Slot()
     def validate_practice_times(self):
@@ -1048,19 +1113,19 @@ class MainWindow(QWidget):
         Validates the practice times based on the minimum duration and the round type duration.
 
         """
-        # Get the start and end practice times, minimum duration, and default duration
-        start_practice = self.start_time_practice_rounds.time()
-        end_practice = self.stop_time_practice_rounds.time()
+        # Get the minimum duration in minutes
         min_duration = self.minimum_practice_duration.time()
-        duration = self.round_type_durations[KEY.PRACTICE]
-        duration = QTime(0, duration, 0)
+        min_minutes = (
+            min_duration.hour() * TIME.MINUTES_PER_HOUR + min_duration.minute()
+        )
 
         # Compare the duration with the minimum duration
-        if duration < min_duration:
+        delta_secs = (
+            min_minutes - self.round_type_durations[KEY.PRACTICE]
+        ) * TIME.SECS_IN_MINUTE
+        if delta_secs > 0:
             # Adjust the end practice time based on the difference in minutes
-            end_practice = end_practice.addSecs(
-                (min_duration.minute() - duration.minute()) * TIME.SECS_IN_MINUTE
-            )
+            end_practice = self.stop_time_practice_rounds.time().addSecs(delta_secs)
             self.stop_time_practice_rounds.setTime(end_practice)
 
     @Slot()
@@ -1069,16 +1134,16 @@ class MainWindow(QWidget):
         Validates the table times based on the minimum duration and the round type duration.
 
         """
-        start_table = self.start_time_table_rounds.time()
-        end_table = self.stop_time_table_rounds.time()
         min_duration = self.minimum_table_duration.time()
-        duration = self.round_type_durations[KEY.TABLE]
-        duration = QTime(0, duration, 0)
+        min_minutes = (
+            min_duration.hour() * TIME.MINUTES_PER_HOUR + min_duration.minute()
+        )
 
-        if duration < min_duration:
-            end_table = end_table.addSecs(
-                (min_duration.minute() - duration.minute()) * TIME.SECS_IN_MINUTE
-            )
+        delta_secs = (
+            min_minutes - self.round_type_durations[KEY.TABLE]
+        ) * TIME.SECS_IN_MINUTE
+        if delta_secs > 0:
+            end_table = self.stop_time_table_rounds.time().addSecs(delta_secs)
             self.stop_time_table_rounds.setTime(end_table)
 
     def update_schedule_data(self):
@@ -1089,17 +1154,16 @@ class MainWindow(QWidget):
         self.num_teams = self.num_teams_spinbox.value()
         self.num_rooms = self.num_rooms_spinbox.value()
         self.num_tables = self.num_tables_spinbox.value()
-        self.round_types_per_team[KEY.PRACTICE] = self.round_type_spinboxes[
-            KEY.PRACTICE
-        ].value()
-        self.round_types_per_team[KEY.TABLE] = self.round_type_spinboxes[
-            KEY.TABLE
-        ].value()
+        self.round_types_per_team[KEY.PRACTICE] = self.practice_spinbox.value()
+        self.round_types_per_team[KEY.TABLE] = self.table_spinbox.value()
         self.num_tables_and_sides = self.num_tables * 2
-        self.num_tables_and_sides_label.setText(str(self.num_tables_and_sides))
+        self.set_label_text(
+            self.num_tables_and_sides_label, str(self.num_tables_and_sides)
+        )
         for name in [KEY.JUDGING, KEY.PRACTICE, KEY.TABLE]:
-            self.round_type_labels[name].setText(
-                f"{self.num_teams * self.round_types_per_team[name]} Rounds"
+            self.set_label_text(
+                self.round_type_labels[name],
+                f"{self.num_teams * self.round_types_per_team[name]} Rounds",
             )
 
     def update_time_data(self):
@@ -1107,16 +1171,15 @@ class MainWindow(QWidget):
         Updates the TimeData with current GUI inputs.
 
         """
-        jStop = self.start_time_judging_rounds.time().addSecs(
+        jStart = self.start_time_judging_rounds.time()
+        jStop = jStart.addSecs(
             self.round_type_durations[KEY.JUDGING]
             * TIME.SECS_IN_MINUTE
             * self.minimum_slots_required[KEY.JUDGING]
         )
-        self.judging_stop_time.setText(jStop.toString("HH:mm"))
+        self.set_label_text(self.judging_stop_time, jStop.toString("HH:mm"))
 
-        self.judging_rounds_start_time = self.start_time_judging_rounds.time().toString(
-            "hh:mm"
-        )
+        self.judging_rounds_start_time = jStart.toString("hh:mm")
         self.practice_rounds_start_time = (
             self.start_time_practice_rounds.time().toString("hh:mm")
         )
@@ -1172,25 +1235,43 @@ class MainWindow(QWidget):
             self.round_type_durations,
         )
 
+    @Slot()
+    def update_epsilon_decay_labels(self):
+        """
+        Updates the epsilon halfway and total decay episode labels.
+
+        """
+        halfway_decay, total_decay = self.calculate_epsilon_decay_episodes()
+        self.set_label_text(self.epsilon_halfway_label, f"{halfway_decay} Episodes")
+        self.set_label_text(self.epsilon_total_label, f"{total_decay} Episodes")
+
     @Slot()
     def on_update(self):
+        """
+        Schedules a GUI update, coalescing rapid input changes into a single update.
+
+        """
+        self.update_timer.start()
+
+    @Slot()
+    def apply_update(self):
         """
         Updates the GUI based on the current inputs.
 
         """
+        # The worker owns q_learning for the duration of a run
+        if self.training_running:
+            return
+
         self.update_schedule_data()
         self.update_time_data()
 
         # Update soft constraint weights
-        for constraint in self.soft_constraint_weights:
-            self.q_learning.soft_constraints_weight[constraint] = (
-                self.soft_constraint_weights[constraint].value() / 100.0
-            )
-            self.constraint_label[constraint].setText(
-                f"{constraint}: {self.q_learning.soft_constraints_weight[constraint] * 100:.2f}%"
-            )
+        for constraint, slider, label in self.soft_constraint_rows:
+            self.update_soft_constraint(constraint, label, slider.value())
 
-        self.gui_refresh_interval = self.gui_refresh_rate.value()
+        self.gui_max_refresh_rate = self.gui_refresh_rate.value()
+        self.worker.update_interval_ns = int(1e9 / max(1, self.gui_max_refresh_rate))
 
         # Update Q-Learning parameters
         self.q_learning.learning_rate = self.alpha_input.value()
@@ -1201,12 +1282,6 @@ class MainWindow(QWidget):
         self.q_learning.training_episodes = self.training_episodes_input.value()
         self.initialize_schedule_and_states()
 
-        halfway_decay, total_decay, self.decays = (
-            self.calculate_epsilon_decay_episodes()
-        )
-        self.epsilon_halfway_label.setText(f"{halfway_decay} Episodes")
-        self.epsilon_total_label.setText(f"{total_decay} Episodes")
-
         self.progress_bar.setMaximum(self.q_learning.training_episodes)
         self.q_learning.required_schedule_slots = (
             sum(self.round_types_per_team.values()) * self.num_teams
@@ -1224,14 +1299,17 @@ class MainWindow(QWidget):
         )
 
         # Update current stats
-        self.q_learning_label.setText(
-            f"Epsilon: {self.q_learning.epsilon:.2f} \nAlpha: {self.q_learning.learning_rate:.2f} \nGamma: {self.q_learning.discount_factor:.2f} \nEpisodes: {self.q_learning.training_episodes}"
+        self.set_label_text(
+            self.q_learning_label,
+            f"Epsilon: {self.q_learning.epsilon:.2f} \nAlpha: {self.q_learning.learning_rate:.2f} \nGamma: {self.q_learning.discount_factor:.2f} \nEpisodes: {self.q_learning.training_episodes}",
         )
-        self.current_schedule_length_label.setText(
-            f"Required Schedule Slots: {self.q_learning.required_schedule_slots} ({self.q_learning.possible_schedule_slots} Possible)"
+        self.set_label_text(
+            self.current_schedule_length_label,
+            f"Required Schedule Slots: {self.q_learning.required_schedule_slots} ({self.q_learning.possible_schedule_slots} Possible)",
         )
-        self.q_table_size_label.setText(
-            f"Q-Table Size: {len(self.q_learning.q_table)}/{self.q_learning.q_table_size_limit}"
+        self.set_label_text(
+            self.q_table_size_label,
+            f"Q-Table Size: {len(self.q_learning.q_table)}/{self.q_learning.q_table_size_limit}",
         )
 
         self.q_learning.practice_teams_available = (
@@ -1242,72 +1320,143 @@ class MainWindow(QWidget):
         )
 
         # Update TimeData with current GUI inputs
-        self.practice_round_duration.setText(
-            f"{self.round_type_durations[KEY.PRACTICE]} minutes"
+        self.set_label_text(
+            self.practice_round_duration,
+            f"{self.round_type_durations[KEY.PRACTICE]} minutes",
         )
-        self.table_round_duration.setText(
-            f"{self.round_type_durations[KEY.TABLE]} minutes"
+        self.set_label_text(
+            self.table_round_duration,
+            f"{self.round_type_durations[KEY.TABLE]} minutes",
         )
-        self.practice_time_available.setText(
-            f"{self.available_practice_duration} minutes"
+        self.set_label_text(
+            self.practice_time_available,
+            f"{self.available_practice_duration} minutes",
+        )
+        self.set_label_text(
+            self.table_time_available, f"{self.available_table_duration} minutes"
         )
-        self.table_time_available.setText(f"{self.available_table_duration} minutes")
 
-        self.status_label.setText(f"Waiting for User to Complete Initialization")
+        self.set_label_text(
+            self.status_label, f"Waiting for User to Complete Initialization"
+        )
         self.initialize_schedule_display()
 
         self.validate_practice_times()
         self.validate_table_times()
 
-    @Slot(int)
-    def update_gui_total(self, episode):
+    def update_soft_constraint(self, constraint, label, value):
         """
-        Updates the GUI based on the current episode.
+        Updates the weight and label of the soft constraint whose slider moved.
 
         """
-        if episode == -2:  # Optimal
-            self.status_label.setText(
-                f"Optimal Scheduling: Scheduling complete!\nOptimal Schedule Generated at exports/grid_optimal_schedule.xlsx"
-            )
-            self.q_learning_label.setText(
-                f"Epsilon: {self.q_learning.epsilon:.2f} (Final)\nAlpha: {self.q_learning.learning_rate:.2f}\nGamma: {self.q_learning.discount_factor:.2f}\nEpisodes: {self.q_learning.training_episodes}"
-            )
-            self.q_table_size_label.setText(
-                f"Q-Table Size: {len(self.q_learning.q_table)}/{self.q_learning.q_table_size_limit} (Final)"
-            )
+        self.set_label_text(label, f"{constraint}: {value}.00%")
+
+        # The worker owns q_learning during a run, on_training_finished applies it after
+        if self.training_running:
+            return
+        self.q_learning.soft_constraints_weight[constraint] = value / 100.0
 
-            # Update the schedule display
-            self.initialize_schedule_display()
-            self.progress_bar.setValue(self.q_learning.training_episodes)
-            self.train_button.setDisabled(False)
-            self.train_button.setText("Close Window")
-            self.worker.signals.gui_updated_signal.emit()
+    def set_label_text(self, label, text):
+        """
+        Sets the text of a label, skipping the update if the text is unchanged.
 
-        elif episode > 0 and episode % self.gui_refresh_rate.value() == 0:
-            # Basic Stats
-            self.status_label.setText(f"Episode {episode} : Scheduling in progress...")
+        """
+        if self.label_cache.get(label) != text:
+            label.setText(text)
+            self.label_cache[label] = text
 
-            self.q_learning_label.setText(
-                f"Epsilon: {self.q_learning.epsilon:.2f}\nAlpha: {self.q_learning.learning_rate:.2f}\nGamma: {self.q_learning.discount_factor:.2f}\nEpisodes: {self.q_learning.training_episodes}"
-            )
-            self.q_table_size_label.setText(
-                f"Q-Table Size: {len(self.q_learning.q_table)}/{self.q_learning.q_table_size_limit}"
-            )
+    @Slot(int)
+    def update_gui_total(self, episode):
+        """
+        Updates the GUI based on the current episode.
 
-            # Update the schedule display
-            self.initialize_schedule_display()
-            self.progress_bar.setValue(episode)
-            self.train_button.setText(
-                f"Training in Progress...{episode}/{self.q_learning.training_episodes}"
-            )
-            self.worker.signals.gui_updated_signal.emit()
+        """
+        self.gui_update_handlers.get(episode, self.update_gui_training)(episode)
 
+        # Acknowledge exactly once per update so the worker resumes
         self.worker.signals.gui_updated_signal.emit()
 
         if not self.thread.isRunning():
             print(f"Thread {self.thread} Stopped")
             return
 
+    def update_gui_training(self, episode):
+        """
+        Updates the GUI for a training episode.
+
+        The worker only sends episodes at the maximum refresh rate, so every update is drawn.
+
+        """
+        if episode <= 0:
+            return
+
+        q_learning = self.q_learning
+        episodes = self.run_training_episodes
+
+        # Basic Stats
+        self.set_label_text(
+            self.status_label, f"Episode {episode} : Scheduling in progress..."
+        )
+        self.set_label_text(
+            self.q_learning_label,
+            f"Epsilon: {q_learning.epsilon:.2f}\nAlpha: {q_learning.learning_rate:.2f}\nGamma: {q_learning.discount_factor:.2f}\nEpisodes: {episodes}",
+        )
+        self.set_label_text(
+            self.q_table_size_label,
+            f"Q-Table Size: {len(q_learning.q_table)}/{self.run_q_table_size_limit}",
+        )
+
+        # Update the schedule display
+        self.update_schedule_display()
+        self.progress_bar.setValue(episode)
+        self.train_button.setText(f"Training in Progress...{episode}/{episodes}")
+
+    def update_gui_optimal(self, episode):
+        """
+        Updates the GUI once the optimal schedule has been generated.
+
+        """
+        q_learning = self.q_learning
+        episodes = self.run_training_episodes
+
+        self.set_label_text(
+            self.status_label,
+            "Optimal Scheduling: Scheduling complete!\nExporting Optimal Schedule...",
+        )
+        self.set_label_text(
+            self.q_learning_label,
+            f"Epsilon: {q_learning.epsilon:.2f} (Final)\nAlpha: {q_learning.learning_rate:.2f}\nGamma: {q_learning.discount_factor:.2f}\nEpisodes: {episodes}",
+        )
+        self.set_label_text(
+            self.q_table_size_label,
+            f"Q-Table Size: {len(q_learning.q_table)}/{self.run_q_table_size_limit} (Final)",
+        )
+
+        # Update the schedule display
+        self.update_schedule_display()
+        self.progress_bar.setValue(episodes)
+        self.train_button.setText("Exporting Optimal Schedule...")
+
+    @Slot()
+    def on_training_finished(self):
+        """
+        Marks training complete once the worker has finished exporting.
+
+        """
+        self.set_label_text(
+            self.status_label,
+            f"Optimal Scheduling: Scheduling complete!\nOptimal Schedule Generated at exports/grid_optimal_schedule.xlsx",
+        )
+        self.training_running = False
+        self.training_complete = True
+
+        # Apply slider moves made during the run
+        for constraint, slider, label in self.soft_constraint_rows:
+            self.update_soft_constraint(constraint, label, slider.value())
+
+        self.train_button.setDisabled(False)
+        self.train_button.setText("Close Window")
+
 
 if __name__ == "__main__":
     app = QApplication([])
@@ -686,6 +686,7 @@ class QLearning:
         """
         self.schedule = self.initialize_schedule()
         self.staticStates = [tuple(i) for i in self.schedule]
+        self.state_index = {state: i for i, state in enumerate(self.staticStates)}
 
         self.initialize_judging_rounds()
         self.states = [tuple(i) for i in self.schedule if i[5] is None]
@@ -821,7 +822,7 @@ class QLearning:
                     episode_reward += reward
 
                     self.states.remove(current_state)
-                    self.staticStates[self.staticStates.index(current_state)] = (
+                    self.staticStates[self.state_index[current_state]] = (
                         current_start_time,
                         current_end_time,
                         current_round_type,
@@ -896,7 +897,7 @@ class QLearning:
                     )
                     self.update_schedule(current_state, best_action)
 
-                    self.staticStates[self.staticStates.index(current_state)] = (
+                    self.staticStates[self.state_index[current_state]] = (
                         current_state[0],
                         current_state[1],
                         current_state[2],
@@ -906,6 +907,12 @@ class QLearning:
                     )
 
             self.states.remove(current_state)
+
+    def export_optimal_schedule(self) -> None:
+        """
+        Export the Q-Table and the optimal schedule.
+
+        """
         q_table_filename = (
             EXPORT.EXPORTS_DIRECTORY + EXPORT.Q_TABLE_CSV_FILENAME + EXPORT.CSV_EXT
         )
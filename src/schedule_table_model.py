@@ -0,0 +1,132 @@
+from functools import lru_cache
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtGui import QBrush, QColor
+
+
+@lru_cache(maxsize=32)
+def get_judging_headers(num_rooms):
+    """
+    Returns the judging table header labels for the given number of rooms.
+
+    """
+    return ("Time",) + tuple(f"Room {i+1}" for i in range(num_rooms))
+
+
+@lru_cache(maxsize=32)
+def get_table_round_headers(num_tables):
+    """
+    Returns the practice and table round header labels for the given number of tables.
+
+    """
+    return ("Time",) + tuple(
+        f"Table {chr(65 + i // 2)}{i % 2 + 1}" for i in range(num_tables * 2)
+    )
+
+
+class ScheduleTableModel(QAbstractTableModel):
+    """
+    Table model holding one schedule display as rows of precomputed strings.
+
+    """
+
+    def __init__(self, parent=None):
+        """
+        Initialize ScheduleTableModel object.
+
+        """
+        super().__init__(parent)
+
+        self.headers = ()
+        self.rows = []  # [[time, cell, cell, ...], ...]
+        self.team_brushes = {}
+        self.highlight_value = None
+        self.highlight_brush = QBrush(QColor("yellow"))
+
+    def rowCount(self, parent=QModelIndex()):
+        """
+        Returns the number of time slot rows.
+
+        """
+        if parent.isValid():
+            return 0
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        """
+        Returns the number of columns, including the time column.
+
+        """
+        if parent.isValid():
+            return 0
+        return len(self.headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        """
+        Returns the horizontal header labels.
+
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.headers[section]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.DisplayRole):
+        """
+        Returns the cell text, or its team color for the background role.
+
+        """
+        if not index.isValid():
+            return None
+
+        text = self.rows[index.row()][index.column()]
+        if role == Qt.DisplayRole:
+            return text
+        if role == Qt.BackgroundRole and text is not None:
+            if text == self.highlight_value:
+                return self.highlight_brush
+            if index.column() > 0 and text != "None":
+                return self.team_brushes.get(int(text))
+        return None
+
+    def set_schedule(self, headers, rows, team_brushes):
+        """
+        Replaces the headers and rows with a single model reset.
+
+        """
+        if headers == self.headers and len(rows) == len(self.rows):
+            # Same layout, only the cell contents changed
+            self.rows = rows
+            self.team_brushes = team_brushes
+            self.highlight_value = None
+            self.refresh()
+            return
+
+        self.beginResetModel()
+        self.headers = headers
+        self.rows = rows
+        self.team_brushes = team_brushes
+        self.highlight_value = None
+        self.endResetModel()
+
+    def refresh(self):
+        """
+        Notifies the view that any cell may have changed.
+
+        """
+        if self.rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.rows) - 1, len(self.headers) - 1),
+            )
+
+    def set_highlight(self, value):
+        """
+        Highlights every cell whose text matches the given value.
+
+        """
+        self.highlight_value = value
+        if self.rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self.rows) - 1, len(self.headers) - 1),
+                [Qt.BackgroundRole],
+            )
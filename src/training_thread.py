@@ -1,14 +1,19 @@
-from PySide6.QtCore import QObject, Signal, Slot, QWaitCondition, QMutex, Qt
+import time
+from PySide6.QtCore import QObject, Signal, Slot, QSemaphore, Qt
 from gui_signals import GUISignals
+from config import GUIConfig
+
+GUI = GUIConfig()
 
 
 class TrainingWorker(QObject):
     """
-    Class to handle the training process as a QThread.
+    Class to handle the training process on a persistent QThread.
 
     """
 
     finished = Signal()
+    run_requested = Signal()
 
     def __init__(self, q_learning):
         """
@@ -19,9 +24,11 @@ class TrainingWorker(QObject):
 
         self.q_learning = q_learning
         self.signals = GUISignals()
-        self.wait_condition = QWaitCondition()  # Add a wait condition
-        self.mutex = QMutex()  # Add a mutex
+        self.gui_ack = QSemaphore(0)  # Released by the GUI once per handled update
+        self.update_interval_ns = int(1e9 / GUI.MAX_REFRESH_RATE)  # Set by the GUI
+        self.stop_requested = False  # Set from the GUI thread on shutdown
         self.signals.gui_updated_signal.connect(self.gui_updated, Qt.DirectConnection)
+        self.run_requested.connect(self.run, Qt.QueuedConnection)
 
     @Slot()
     def run(self):
@@ -29,29 +36,64 @@ class TrainingWorker(QObject):
         Run the training process.
 
         """
+        # Clear previous exports off the GUI thread, before any new file is written
+        self.q_learning.exporter.clear_exports_directory()
+
         # Training
-        for episode in range(1, self.q_learning.training_episodes + 1):
-            self.q_learning.train_one_episode(episode)
-            self.signals.update_gui_signal.emit(episode)
-            self.mutex.lock()
-            self.wait_condition.wait(self.mutex)  # Wait on the condition
-            self.mutex.unlock()
+        train_one_episode = self.q_learning.train_one_episode
+        emit_and_wait = self.emit_and_wait
+        training_episodes = self.q_learning.training_episodes
+        last_update_ns = 0
+        for episode in range(1, training_episodes + 1):
+            if self.stop_requested:
+                return
+            train_one_episode(episode)
+
+            # Sync with the GUI at most at its refresh rate, and always on the last episode
+            if (
+                time.monotonic_ns() - last_update_ns >= self.update_interval_ns
+                or episode == training_episodes
+            ):
+                emit_and_wait(episode)
+                last_update_ns = time.monotonic_ns()
+
+        if self.stop_requested:
+            return
 
         # Optimal Schedule
         self.q_learning.generate_optimal_schedule()
-        self.signals.update_gui_signal.emit(-2)
-        self.mutex.lock()
-        self.wait_condition.wait(self.mutex)  # Wait on the condition
-        self.mutex.unlock()
+        self.emit_and_wait(GUI.OPTIMAL_EPISODE)
 
+        if self.stop_requested:
+            return
+
+        # Export after the GUI already shows the optimal schedule
+        self.q_learning.export_optimal_schedule()
         self.finished.emit()
 
+    def emit_and_wait(self, episode):
+        """
+        Emit a GUI update and block until the GUI acknowledges it.
+
+        """
+        # The semaphore counts, so an ack that arrives before acquire is not lost
+        self.signals.update_gui_signal.emit(episode)
+        while not self.gui_ack.tryAcquire(1, GUI.ACK_POLL_INTERVAL):
+            if self.stop_requested:
+                return
+
+    def request_stop(self):
+        """
+        Ask a running training loop to return, waking it if it waits on the GUI.
+
+        """
+        self.stop_requested = True
+        self.gui_ack.release()
+
     @Slot()
     def gui_updated(self):
         """
         Slot to handle the GUI updated signal.
 
         """
-        self.mutex.lock()
-        self.wait_condition.wakeOne()  # Wake up the waiting thread
-        self.mutex.unlock()
+        self.gui_ack.release()  # Wake up the waiting thread
@@ -2,6 +2,12 @@
 This module contains utility functions for the Q-learning algorithm.
 
 """
+import math
+from functools import lru_cache
+
+__all__ = ["normalize_reward", "calculate_epsilon_decays"]
+
+EPSILON_HALFWAY = 0.5
 
 
 def normalize_reward(reward, min_reward, max_reward) -> float:
@@ -12,4 +18,35 @@ def normalize_reward(reward, min_reward, max_reward) -> float:
     if max_reward - min_reward == 0:
         return 0
     else:
-        return (reward - min_reward) / (max_reward - min_reward)
\ No newline at end of file
+        return (reward - min_reward) / (max_reward - min_reward)
+
+
+@lru_cache(maxsize=128)
+def calculate_epsilon_decays(epsilon_start, epsilon_end, epsilon_decay) -> tuple:
+    """
+    Calculate the episodes until epsilon decays to halfway and to its end value.
+
+    Results are cached, as the inputs repeat across GUI updates.
+
+    Returns:
+        tuple: Halfway episode count and total episode count.
+
+    """
+    # Epsilon never reaches the end value unless it actually decays
+    if epsilon_start <= epsilon_end or not 0 < epsilon_decay < 1:
+        return 0, 0
+
+    # Number of decays until epsilon reaches the end value, in closed form
+    ep_count = math.ceil(
+        math.log(epsilon_end / epsilon_start) / math.log(epsilon_decay)
+    )
+
+    # Number of decayed values still greater than halfway
+    ep_count_half = 0
+    if epsilon_start > EPSILON_HALFWAY:
+        decays_to_halfway = math.ceil(
+            math.log(EPSILON_HALFWAY / epsilon_start) / math.log(epsilon_decay)
+        )
+        ep_count_half = min(decays_to_halfway - 1, ep_count)
+
+    return ep_count_half, ep_count
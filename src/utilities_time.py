@@ -1,8 +1,9 @@
-from datetime import datetime, timedelta
+import math
 import config
 
 TIME = config.TimeDataDefaultConfig()
 FORMAT = config.FormatsConfig()
+MINUTES_PER_DAY = TIME.HOURS_PER_DAY * TIME.MINUTES_PER_HOUR
 
 
 # General Time Functions
@@ -17,12 +18,32 @@ def time_to_minutes(time_str):
         int: Time in minutes.
 
     """
-    # Convert time string to datetime object
+    # Split and convert directly, strptime re-parses the format on every call
     try:
-        time = datetime.strptime(time_str, FORMAT.TIME_FORMAT)
-        return time.hour * TIME.MINUTES_PER_HOUR + time.minute
+        hours, minutes = time_str.split(":")
+        hour, minute = int(hours), int(minutes)
     except ValueError:
         raise ValueError(f"Invalid time format: {time_str}. Expected format: HH:MM")
+    if not (0 <= hour < TIME.HOURS_PER_DAY and 0 <= minute < TIME.MINUTES_PER_HOUR):
+        raise ValueError(f"Invalid time format: {time_str}. Expected format: HH:MM")
+    return hour * TIME.MINUTES_PER_HOUR + minute
+
+
+def minutes_to_time(total_minutes):
+    """
+    Convert minutes to a time string, wrapping past midnight.
+
+    Args:
+        total_minutes (int | float): Time in minutes, partial minutes are dropped.
+
+    Returns:
+        str: Time string in the format HH:MM.
+
+    """
+    # Floor like the old timedelta + strftime path, durations may arrive as floats
+    total_minutes = math.floor(total_minutes) % MINUTES_PER_DAY
+    hour, minute = divmod(total_minutes, TIME.MINUTES_PER_HOUR)
+    return f"{hour:02d}:{minute:02d}"
 
 
 def add_minutes_to_time(time_str, minutes):
@@ -37,12 +58,7 @@ def add_minutes_to_time(time_str, minutes):
         str: Time string in the format HH:MM.
 
     """
-    try:
-        start_time = datetime.strptime(time_str, FORMAT.TIME_FORMAT)
-        end_time = start_time + timedelta(minutes=minutes)
-        return end_time.strftime(FORMAT.TIME_FORMAT)
-    except ValueError:
-        raise ValueError(f"Invalid time format: {time_str}. Expected format: HH:MM")
+    return minutes_to_time(time_to_minutes(time_str) + minutes)
 
 
 def is_time_overlaps(slot1, slot2):
@@ -57,9 +73,8 @@ def is_time_overlaps(slot1, slot2):
         bool: True if the time slots overlap, False otherwise.
 
     """
-    format_str = FORMAT.TIME_FORMAT  # Time format
-    start1, end1 = map(lambda x: datetime.strptime(x, format_str), slot1)
-    start2, end2 = map(lambda x: datetime.strptime(x, format_str), slot2)
+    start1, end1 = map(time_to_minutes, slot1)
+    start2, end2 = map(time_to_minutes, slot2)
     return max(start1, start2) < min(end1, end2)
 
 
@@ -77,12 +92,13 @@ def generate_start_times_for_round(start_time, num_slots, slot_length):
         list: List of start times in the format HH:MM.
 
     """
+    # Parse once, then step in whole minutes, dropping partial minutes each step
     start_times = []
-    current_time = start_time
+    current_minutes = time_to_minutes(start_time)
 
     for _ in range(num_slots):
-        start_times.append(current_time)
-        current_time = add_minutes_to_time(current_time, slot_length)
+        start_times.append(minutes_to_time(current_minutes))
+        current_minutes = math.floor(current_minutes + slot_length)
 
     return start_times
 
@@ -99,10 +115,7 @@ def generate_end_times_for_round(start_times, duration):
         list: List of tuples containing the start and end times in the format (HH:MM, HH:MM).
 
     """
-    end_times = []
-
-    for start_time in start_times:
-        end_time = add_minutes_to_time(start_time, duration)
-        end_times.append((start_time, end_time))
-
-    return end_times
+    return [
+        (start_time, minutes_to_time(time_to_minutes(start_time) + duration))
+        for start_time in start_times
+    ]